@@ -10,16 +10,16 @@ data in the console window, with the most recent updates first.
 
 REQUIREMENTS
    
-1.  Any machine with Python 3.7+ enabled in the command line
+1.  Any machine with Python 3.10+ enabled in the command line
 2.  A LawHub account
 
 HOW TO RUN THIS FILE
    
 0.  If you don't already have the required packages installed, run this:
     
-    pip install time datetime selenium
+    pip install time datetime selenium aiohttp lxml
 
-1.  At line 234 (the very last line of this script), replace YOUR USERNAME HERE and YOUR 
+1.  At line 597 (the very last line of this script), replace YOUR USERNAME HERE and YOUR 
     PASSWORD HERE with your LSAC login. Example:
 
     run_scraper("SuperDuperLawyer9000", "t14hereicome!")    <---- keep the quotes!
@@ -31,18 +31,66 @@ HOW TO RUN THIS FILE
 Happy tracking!
 
 =========================================================================================
-            !!! DO NOT MODIFY ANYTHING UP TO LINE 234 !!!
+            !!! DO NOT MODIFY ANYTHING UP TO LINE 597 !!!
 =========================================================================================
 """
 
+import asyncio
+import json
+import multiprocessing
+import multiprocessing.util
+import os
+import re
+import signal
+import sys
 import time
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from http.cookies import CookieError, Morsel
+
+import aiohttp
+from lxml import etree, html
 from selenium import webdriver
+from selenium.common.exceptions import (
+    NoSuchElementException, TimeoutException, WebDriverException)
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
+LAWHUB_ORIGIN = 'https://app.lawhub.org/'
+LAWHUB_URL = 'https://app.lawhub.org/applications'
+SESSION_FILE = '.lawhub_session.json' # cached login cookies, reused on later runs
+MAX_WORKERS = 8 # each worker runs its own Chrome, so keep this modest
+CHROME_FLAGS = [ # trim GPU, sandbox, cache, and other overhead a text scraper doesn't need
+    '--disable-gpu', '--no-sandbox', '--disable-dev-shm-usage', '--disable-extensions',
+    '--disable-features=AudioServiceOutOfProcess,Translate', '--disk-cache-size=1',
+    '--incognito', '--no-zygote', '--blink-settings=imagesEnabled=false'
+]
+BLOCKED_URLS = ["*.png", "*.jpg", "*.gif", "*.svg", "*.woff*", "*.css"]
+NO_DATE = "0001-01-01" # "impossible" ISO date for statuses without one, so they sort last
+
+SEP = '=' * 75 + '\n' # record separators, built once rather than per printed school
+SUB_SEP = '_' * 75 + '\n'
+OF_RE = re.compile(r'\bOf(\s+The)?\b') # "Of"/"Of The" as whole words, after str.title()
+
+_worker_cookies = None # each pool worker's copy of the LawHub session, set by _init_worker
+_worker_cancelled = None # each pool worker's view of the Ctrl-C flag, set by _init_worker
+_worker_driver = None # each pool worker's own driver, launched by _worker_chrome on first use
+_worker_quit = None # quits _worker_driver, at worker exit or when _drop_worker_chrome calls it
+
+
+@dataclass(slots=True)
+class SchoolStatus:
+    """ A law school's portal link, along with the status text and ISO date scraped from it
+    """
+    
+    link: str
+    text: str = ""
+    date: str = NO_DATE
+
 
 def run_scraper(username, password):
     """ The meat and potatoes; runs entire script process
@@ -54,17 +102,22 @@ def run_scraper(username, password):
     
     start_time = time.time()
     
-    """Initiate driver instance"""
-    options = webdriver.ChromeOptions()
-    options.add_experimental_option('excludeSwitches', ['enable-logging'])
-    options.add_argument('log-level=3') # log nothing except any error fatal to the code
-    driver = webdriver.Chrome(
-        options=options,
-    )
+    """Initiate driver instance, in the background while the cached session is read"""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        starting = executor.submit(new_driver)
+        cached_cookies = load_session()
+        driver = starting.result() # re-raises here if Chrome failed to start
+    
+    session = restore_session(driver, cached_cookies)
+    if session: schools, applicant_name = session
+    else:
+        driver.delete_all_cookies() # drop any expired cookies before signing in for real
+        schools, applicant_name = lawhub_signin(username, password, driver)
+        save_session(driver)
+    cookies = driver.get_cookies() # LawHub session, handed to the HTTP pass and every worker
+    driver.quit() # everything else runs off plain strings, so free this Chrome up front
     
-    buttons, applicant_name = lawhub_signin(username, password, driver)
-    sorted_info = get_statuses(buttons, driver)
-    driver.quit()
+    sorted_info = get_statuses(schools, cookies)
     
     print("\nLSAC Statuses for " + applicant_name)
     print("Retrieved {}\n".format(
@@ -76,6 +129,31 @@ def run_scraper(username, password):
     print("\nStatuses retrieved in: {} seconds".format(elapsed_time))
     
     
+def new_driver():
+    """ Helper function: Launches a headless Chrome instance with console logging silenced and 
+        images, fonts, and stylesheets blocked, since only the page text is ever read
+
+    Returns:
+        driver (WebDriver): A fresh driver reference
+    """
+    
+    options = webdriver.ChromeOptions()
+    options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    options.add_argument('log-level=3') # log nothing except any error fatal to the code
+    options.add_argument('--headless=new') # the script never needs a visible window
+    for flag in CHROME_FLAGS: options.add_argument(flag)
+    options.page_load_strategy = 'eager' # return at DOMContentLoaded, not after subresources
+    driver = webdriver.Chrome(
+        options=options,
+        service=Service(log_output=os.devnull), # keep chromedriver's own log off the console
+        keep_alive=True, # reuse one HTTP connection to chromedriver for every command
+    )
+    
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    return driver
+    
+    
 def lawhub_signin(username, password, driver):
     """ Receives authentication information and driver reference and signs into LawHub
 
@@ -85,149 +163,434 @@ def lawhub_signin(username, password, driver):
         driver (WebDriver): The driver reference, passed through
         
     Returns:
-        buttons (list): List of WebElements corresponding to the "View Details" buttons
+        schools (list): (link, school_name) for each "View Details" portal link
         applicant_name (str): Applicant's preferred first name, retrieved through LawHub
     """
     
-    lawhub_url = 'https://app.lawhub.org/applications'
-    driver.get(lawhub_url)
+    driver.get(LAWHUB_URL)
     
     # Wait until sign-in button shows up in top-right
-    wait = WebDriverWait(driver, 10)
-    wait.until(EC.element_to_be_clickable((By.XPATH, "//*[contains(text(), 'Sign-in')]")))
-    sign_in = driver.find_element(By.XPATH, "//*[contains(text(), 'Sign-in')]")
+    wait = WebDriverWait(driver, 10, poll_frequency=0.1)
+    sign_in = wait.until(EC.element_to_be_clickable((By.XPATH, "//*[contains(text(), 'Sign-in')]")))
     sign_in.click()
     
     # Wait until orange "sign-in" button shows up, then log in
-    wait = WebDriverWait(driver, 10)
-    wait.until(EC.element_to_be_clickable((By.XPATH, '//*[@id=\"next\"]')))
+    wait = WebDriverWait(driver, 10, poll_frequency=0.1)
+    login = wait.until(EC.element_to_be_clickable((By.XPATH, '//*[@id=\"next\"]')))
     user = driver.find_element(By.ID, "logonIdentifier")
     pwd = driver.find_element(By.ID, "password")
-    login = driver.find_element(By.XPATH, '//*[@id=\"next\"]')
     user.send_keys(username)
     pwd.send_keys(password)
     login.click()
     
-    # Wait until page loads properly, with portal links
-    wait = WebDriverWait(driver, 10)
-    wait.until(EC.all_of(
-        EC.title_contains('Application Status Tracker'),
-        EC.visibility_of_any_elements_located((By.XPATH, "//*[@id=\"welcome-menu\"]/span")),
-        EC.visibility_of_any_elements_located((By.XPATH, "//a[text()='View details']"))
-    ))
+    return applications_page(driver, 10)
+    
+    
+def restore_session(driver, cookies):
+    """ Loads cached LawHub cookies into the driver and checks whether that session still works,
+        which skips the whole sign-in flow on re-runs
+
+    Args:
+        driver (WebDriver): The driver reference, passed through
+        cookies (list): Cached cookies from load_session, or None if there weren't any
+        
+    Returns:
+        (schools, applicant_name) as in lawhub_signin, or None if there's no usable cached session
+    """
+    
+    if cookies is None: return None
+    
+    # Any failure here, from a rejected cookie to an expired session, means a full sign-in
+    try:
+        driver.get(LAWHUB_ORIGIN) # cookies can only be added on a page of their own domain
+        for c in cookies: driver.add_cookie(c)
+        driver.get(LAWHUB_URL)
+        return applications_page(driver, 3)
+    except WebDriverException: # includes TimeoutException
+        return None
+    
+    
+def load_session():
+    """ Helper function: Reads cached LawHub cookies from SESSION_FILE, or None if there aren't any 
+        or the file isn't the list of cookie dicts save_session writes
+    """
+    
+    try:
+        with open(SESSION_FILE) as f: cookies = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cookies, list): return None
+    if not all(isinstance(c, dict) and isinstance(c.get('name'), str) 
+            and isinstance(c.get('value'), str) for c in cookies):
+        return None
+    return cookies
+    
+    
+def save_session(driver):
+    """ Helper function: Caches the signed-in driver's LawHub cookies to SESSION_FILE, readable 
+        by the current user only since they amount to a replayable login
+    """
+    
+    keys = ('name', 'value', 'domain', 'path', 'expiry', 'secure', 'httpOnly', 'sameSite')
+    cookies = [{k: c[k] for k in keys if k in c} for c in driver.get_cookies()]
+    
+    fd = os.open(SESSION_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    if hasattr(os, 'fchmod'): os.fchmod(fd, 0o600) # also tighten a file left by an older run
+    with os.fdopen(fd, 'w') as f: json.dump(cookies, f)
+    
+    
+def applications_page(driver, timeout):
+    """ Waits for the signed-in Applications page and reads the applicant's name and portal links
+
+    Args:
+        driver (WebDriver): The driver reference, passed through
+        timeout (int): Seconds to wait for the page before raising TimeoutException
+        
+    Returns:
+        schools (list): (link, school_name) for each "View Details" portal link
+        applicant_name (str): Applicant's preferred first name, retrieved through LawHub
+    """
+    
+    # Wait until page loads properly, with portal links - one script call per poll
+    wait = WebDriverWait(driver, timeout, poll_frequency=0.1)
+    wait.until(lambda d: d.execute_script(
+        "return document.title.includes('Application Status Tracker')"
+        " && document.querySelector('#welcome-menu > span') !== null"
+        " && [...document.querySelectorAll('a')].some(a => [...a.childNodes].some("
+        "      n => n.nodeType === Node.TEXT_NODE && n.textContent === 'View details'));"))
     
     applicant_name = driver.find_element(
         By.XPATH, "//*[@id=\"welcome-menu\"]/span").text.split(', ', 1)[1]
-    buttons = driver.find_elements(By.XPATH, "//a[text()='View details']") # gets all portal links
-    return buttons, applicant_name
+    
+    # Pull every portal link and school name in one round trip, as plain strings that can't go 
+    # stale once the driver navigates away
+    pairs = driver.execute_script(
+        "return [...document.querySelectorAll('a')].filter(a => [...a.childNodes].some("
+        "      n => n.nodeType === Node.TEXT_NODE && n.textContent === 'View details'))"
+        "  .map(a => [a.href, a.querySelector('span').innerText.trim()]);")
+    schools = [(l, of_lowercase(s.title())) for l, s in pairs]
+    return schools, applicant_name
     
  
-def get_statuses(buttons, driver):
-    """ Receives authentication information and driver reference and signs into LawHub
+def get_statuses(schools, cookies):
+    """ Fetches every portal over plain HTTP at once, then fans whichever pages need rendering 
+        out across a pool of worker processes, each with its own headless Chrome signed into 
+        the same LawHub session and reused for every school it visits. Each school's status is 
+        printed as soon as it comes in
 
     Args:
-        buttons (list): List of WebElements corresponding to the "View Details" buttons
-        driver (WebDriver): The driver reference, passed through
+        schools (list): (link, school_name) for each law school's portal
+        cookies (list): The signed-in driver's LawHub cookies
         
     Returns:
-        sorted_data (dict): Statuses of form {k, [v1:v3]} in order of decreasing status date
+        sorted_data (dict): SchoolStatus values keyed by school, in order of decreasing status date
     """
     
-    school_data = {}
-    
-    for b in buttons: 
-        l = b.get_attribute("href") # button link
-        s = b.find_element(By.XPATH, "./span").text.title() # school's name
-        school_data[of_lowercase(s)] = [l]
+    # Server-rendered portals are done after this; the rest still need a browser
+    school_data = asyncio.run(get_statuses_http(schools, cookies))
+    tasks = [t for t in schools if t[1] not in school_data]
     
-    for k, v in school_data.items():
-        get_status(k, v, driver)
+    if tasks:
+        # Selenium drivers aren't thread-safe, so parallelize with processes rather than threads
+        cancelled = multiprocessing.Event()
+        pool = multiprocessing.Pool(processes=min(MAX_WORKERS, len(tasks)), 
+            initializer=_init_worker, initargs=(cookies, cancelled))
+        try:
+            for k, v in pool.imap_unordered(_fetch_one, tasks):
+                if v is None: continue
+                print_one(k, v)
+                school_data[k] = v
+        except KeyboardInterrupt:
+            cancelled.set() # workers skip whatever's left, so the join below returns promptly
+            raise
+        finally:
+            # Let workers exit on their own so their drivers quit, rather than being terminated,
+            # even if a task failed
+            pool.close()
+            pool.join()
     
+    sys.stdout.write(SEP)
     sorted_data = reverse_date_sort(school_data)
     return sorted_data
 
 
-def get_status(school_name, data_arr, driver):
-    """ Driver visits a law school's LSAC portal page and collects the relevant status data. 
-        This function makes changes to a single value in the dictionary object
+async def get_statuses_http(tasks, cookies):
+    """ Fetches every law school's portal page concurrently over one HTTP session, printing 
+        each status as soon as it's found
+
+    Args:
+        tasks (list): (link, school_name) for each law school's portal
+        cookies (list): The signed-in driver's LawHub cookies
+        
+    Returns:
+        school_data (dict): SchoolStatus values keyed by school, for server-rendered portals only
+    """
+    
+    # Keep each cookie scoped to its own domain and path, as the browser would. Each is loaded 
+    # on its own with its value left as-is, so same-name cookies don't overwrite each other
+    jar = aiohttp.CookieJar()
+    for c in cookies:
+        m = Morsel()
+        try:
+            m.set(c['name'], c['value'], c['value'])
+        except CookieError:
+            continue # a name aiohttp can't carry; the Chrome fallback still has this cookie
+        m['domain'] = c['domain']
+        m['path'] = c['path']
+        jar.update_cookies([(c['name'], m)])
+    
+    timeout = aiohttp.ClientTimeout(total=5)
+    school_data = {}
+    async with aiohttp.ClientSession(cookie_jar=jar, timeout=timeout) as session:
+        async def fetch(link, school_name):
+            return school_name, await get_status_http(link, session)
+        
+        for done in asyncio.as_completed([fetch(l, k) for l, k in tasks]):
+            k, v = await done
+            if v is None: continue
+            print_one(k, v)
+            school_data[k] = v
+            
+    return school_data
+
+
+async def get_status_http(link, session):
+    """ Fetches a law school's LSAC portal page without a browser and collects the status data, 
+        if the page was rendered server-side
+
+    Args:
+        link (str): The school's portal link
+        session (ClientSession): HTTP session carrying the LawHub cookies
+        
+    Returns:
+        status (SchoolStatus): As in get_status, or None if the page needs a real browser
+    """
+    
+    # Anything odd about the response just sends this school to Chrome instead
+    try:
+        async with session.get(link) as r:
+            r.raise_for_status()
+            page = await r.read()
+            charset = r.charset # None if the header doesn't say; lxml then reads the page's own
+        
+        # Parse bytes, since lxml refuses str pages that open with an <?xml encoding=...?> line.
+        # Same "Application Status:" label and grandparent as get_status, but from raw HTML
+        parser = html.HTMLParser(encoding=charset)
+        tables = html.fromstring(page, parser=parser).xpath(
+            "//*[contains(text(), 'Application Status:')]/../..")
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, LookupError, etree.ParserError):
+        return None # ValueError also covers UnicodeDecodeError
+    if not tables: return None # most likely filled in by JavaScript
+    
+    full_text = " ".join(t.strip() for t in tables[0].itertext() if t.strip())
+    try:
+        return parse_status(link, full_text)
+    except ValueError:
+        return None
+
+
+def _init_worker(cookies, cancelled):
+    """ Pool initializer: stores the LawHub session for this worker's driver. Nothing here may 
+        fail, since Pool keeps respawning workers whose initializer raises
+
+    Args:
+        cookies (list): The signed-in driver's LawHub cookies
+        cancelled (Event): Set by the main process on Ctrl-C, so remaining tasks are skipped
+    """
+    
+    # Leave Ctrl-C to the main process; a worker killed mid-task would leave pool.join() 
+    # waiting on that task forever
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    
+    global _worker_cookies, _worker_cancelled
+    _worker_cookies = cookies
+    _worker_cancelled = cancelled
+
+
+def _worker_chrome():
+    """ Helper function: launches this worker's driver on first use and restores the LawHub 
+        session on it, so a launch failure surfaces as an ordinary task error
+
+    Returns:
+        driver (WebDriver): This worker's driver reference
+    """
+    
+    global _worker_driver, _worker_quit
+    if _worker_driver is None:
+        driver = new_driver()
+        try:
+            driver.get(LAWHUB_ORIGIN) # cookies can only be added on a page of their own domain
+            for c in _worker_cookies: driver.add_cookie(c)
+        except WebDriverException:
+            driver.quit()
+            raise
+        
+        # Quit the driver when the worker process exits cleanly
+        _worker_quit = multiprocessing.util.Finalize(None, driver.quit, exitpriority=10)
+        _worker_driver = driver
+        
+    return _worker_driver
+
+
+def _drop_worker_chrome():
+    """ Helper function: quits this worker's driver as far as it still can and forgets it, so 
+        the next task launches a fresh Chrome instead of reusing a broken one
+    """
+    
+    global _worker_driver
+    _worker_driver = None
+    try:
+        _worker_quit() # also unregisters it, so the exit finalizer won't retry a dead driver
+    except Exception:
+        pass # chromedriver may already be gone; there's nothing left to clean up then
+
+
+def _fetch_one(task):
+    """ Pool worker: collects a single school's status data with this worker's driver
+
+    Args:
+        task (tuple): (link, school_name) for one law school's portal
+        
+    Returns:
+        (school_name, status): The school's name and its SchoolStatus, or None if the run was 
+            cancelled before this school came up
+    """
+    
+    link, school_name = task
+    if _worker_cancelled.is_set(): return school_name, None
+    
+    driver = _worker_chrome()
+    try:
+        return school_name, get_status(school_name, link, driver)
+    except WebDriverException:
+        # One crashed page shouldn't sink the schools already collected, nor the ones after it
+        _drop_worker_chrome()
+        return school_name, not_found(link)
+
+
+def get_status(school_name, link, driver):
+    """ Driver visits a law school's LSAC portal page and collects the relevant status data
 
     Args:
         school_name (str): A law school's name
+        link (str): The school's portal link
         driver (WebDriver): The driver reference, passed through
         
     Returns:
-        sorted_data (dict): Statuses of form {k, [v1:v3]} in order of decreasing status date
+        status (SchoolStatus): The school's link, status text, and ISO status date
     """
     
-    driver.get(data_arr[0]) # go to link, in this case [v1]
+    # Go to link, reusing the current tab without waiting on a full page load. Blank the tab 
+    # first so the previous school's page can never pass for this one's
+    driver.execute_cdp_cmd("Page.navigate", {"url": "about:blank"})
+    nav = driver.execute_cdp_cmd("Page.navigate", {"url": link})
+    
+    # CDP reports a navigation that never committed (e.g. net::ERR_ABORTED) instead of raising
+    if nav.get("errorText"): return not_found(link)
     
-    # Wait until portal page loads properly
-    wait = WebDriverWait(driver, 10)
-    wait.until(EC.all_of(
-        EC.title_contains('Applicant Status Online'),
-        EC.visibility_of_any_elements_located((By.CSS_SELECTOR, "div[class = 'section-header']"))
-    ))
-
     try:
-        status = driver.find_element(By.XPATH, "//*[contains(text(), 'Application Status:')]")
-        table = status.find_elements(By.XPATH, "./../..")
+        # Wait until the status section shows up - one script call per poll
+        wait = WebDriverWait(driver, 10, poll_frequency=0.1)
+        wait.until(lambda d: d.execute_script(
+            "return location.href !== 'about:blank'"
+            " && document.querySelector(\"div[class = 'section-header']\") !== null;"))
         
-        full_text = table[0].text
+        # Find the "Application Status:" label and read its grandparent's text in one script call.
+        # This doesn't wait, so a page without the label bails out right away
+        full_text = driver.execute_script(
+            "const el = [...document.querySelectorAll('body *')].find(e => [...e.childNodes].some("
+            "      n => n.nodeType === Node.TEXT_NODE && n.textContent.includes('Application Status:')));"
+            "return el?.parentElement?.parentElement?.innerText.trim() ?? null;")
+        if full_text is None: raise NoSuchElementException("No 'Application Status:' on page")
         
-        # Get rid of "CAS Report Status"
-        if 'CAS' in full_text: full_text = full_text.split("CAS Report Status:", 1)[0].rstrip()
+        return parse_status(link, full_text)
+    except (NoSuchElementException, TimeoutException, ValueError):
+        # If no "Application Status" appears (or its date can't be read), return this message 
+        # with the manual tracker link
+        return not_found(link)
 
-        # Basically, if the status does not have a date, use an "impossible" date
-        if 'Date' not in full_text:
-            data_arr += [full_text, "01/01/0001"]
-        else:
-            split_arr = full_text.split(" Date: ", 1)
 
-            # Handle case for blank date - same "impossible" date for sorting
-            if split_arr[1] == "": split_arr[1] = "01/01/0001"
-            
-            data_arr += split_arr
-    except:
-        # If no "Application Status" appears, return this message with the manual tracker link
-        data_arr += ["App status not found." +  
-            "\nPlease manually check tracker for a potential decision!\n" 
-            + data_arr[0], "01/01/0001"]
+def not_found(link):
+    """ Helper function: Status telling the applicant to check a portal by hand, with its link
+    """
+    
+    return SchoolStatus(link, "App status not found." +  
+        "\nPlease manually check tracker for a potential decision!\n" + link)
+
+
+def parse_status(link, full_text):
+    """ Helper function: Splits a portal's "Application Status:" text into status and ISO date
+    
+    Returns:
+        status (SchoolStatus): The school's link, status text, and ISO status date
+    """
+    
+    # Get rid of "CAS Report Status"
+    head, sep, _ = full_text.partition("CAS Report Status:")
+    if sep: full_text = head.rstrip()
+
+    # Basically, if the status does not have a date, use an "impossible" date
+    text, sep, date = full_text.partition(" Date: ")
+    if not sep: return SchoolStatus(link, full_text)
+
+    # Handle case for blank date - same "impossible" date for sorting
+    if date == "": return SchoolStatus(link, text)
+    
+    return SchoolStatus(link, text, iso_date(date)) # ISO sorts as a string
 
 
 def reverse_date_sort(data_dict):
-    """ Helper function: Sorts dictionary with form {k, [v1:v3]} in order of decreasing status date
+    """ Helper function: Sorts dictionary of SchoolStatus values in order of decreasing status date
     
     Returns:
-        data_dict with form {k, [v1:v3]}, sorted decreasingly by date in v2
+        data_dict of SchoolStatus values, sorted decreasingly by ISO date
     """
     
-    return dict(sorted(data_dict.items(), 
-        key=lambda x: datetime.strptime(x[1][2], '%m/%d/%Y'), reverse=True))
+    return dict(sorted(data_dict.items(), key=lambda x: x[1].date, reverse=True))
    
    
 def print_all(data_dict):
-    """ Helper function: Prints out formatted dictionary with form {k, [v1:v3]}, with "01/01/0001" 
+    """ Helper function: Prints out formatted dictionary of SchoolStatus values, with "0001-01-01" 
         date considered
     """
     
-    for k, v in data_dict.items():
-        print('=' * 75)
-        print(k.center(75))
-        print('_' * 75)
-        
-        if v[2] != "01/01/0001": print(v[1] + " Date: " + v[2]) # throw out any "dates" like these
-        else: print(v[1])
+    for k, v in data_dict.items(): print_one(k, v)
+    sys.stdout.write(SEP)
    
-    print('=' * 75)
    
+def print_one(school_name, status):
+    """ Helper function: Prints out a single school's formatted SchoolStatus, with "0001-01-01" 
+        date considered
+    """
+    
+    # Throw out any "dates" like these
+    if status.date != NO_DATE: text = status.text + " Date: " + us_date(status.date)
+    else: text = status.text
+    
+    sys.stdout.write(SEP + school_name.center(75) + '\n' + SUB_SEP + text + '\n') # one write per school
+   
+
+def iso_date(s):
+    """ Helper function: converts a portal's MM/DD/YYYY date into YYYY-MM-DD
+    """
+    
+    return datetime.strptime(s, '%m/%d/%Y').strftime('%Y-%m-%d')
+
 
+def us_date(s):
+    """ Helper function: converts a YYYY-MM-DD date back into MM/DD/YYYY for display
+    """
+    
+    y, m, d = s.split('-')
+    return m + '/' + d + '/' + y
+   
+   
 def of_lowercase(s):
     """ Helper function: corrects "of" title cases in law school names
     """
     
-    if 'Of The' in s: s = s.replace('Of The', 'of the')
-    if 'Of' in s: s = s.replace('Of', 'of')
-    return s
+    return OF_RE.sub(lambda m: 'of the' if m.group(1) else 'of', s)
    
    
 if __name__=="__main__":